@@ -11,6 +11,7 @@
 // SPDX-License-Identifier: Apache-2.0 OR MIT
 
 use core::time::Duration;
+use iceoryx2::clock::Time;
 use iceoryx2::prelude::*;
 use transmission_data::TransmissionData;
 
@@ -26,8 +27,16 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
     let publisher = service.publisher().create()?;
 
     let mut counter: u64 = 0;
+    let mut deadline = Time::now()? + CYCLE_TIME;
+
+    while let Iox2Event::Tick = Iox2::wait_until(deadline) {
+        deadline += CYCLE_TIME;
+        let now = Time::now()?;
+        if deadline < now {
+            // at least one cycle was missed, resync instead of catching up with a burst
+            deadline = now + CYCLE_TIME;
+        }
 
-    while let Iox2Event::Tick = Iox2::wait(CYCLE_TIME) {
         counter += 1;
         let sample = publisher.loan_uninit()?;
 
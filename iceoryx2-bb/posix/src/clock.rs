@@ -16,6 +16,8 @@
 //! * [`ClockType`] - describes certain types of clocks
 //! * [`nanosleep()`] & [`nanosleep_with_clock()`] - wait a defined amount of time on a custom
 //!                           clock
+//! * [`nanosleep_until()`] - wait until an absolute point in time is reached, useful for
+//!                           periodic loops which shall not drift
 //! * [`AsTimeval`] - trait for easy [`posix::timeval`] conversion, required for low level posix
 //!                     calls
 //! * [`AsTimespec`] - trait for easy [`posix::timespec`] conversion, required for low level posix
@@ -35,6 +37,14 @@ pub enum TimeError {
     UnknownError(i32),
 }
 
+impl std::fmt::Display for TimeError {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        std::write!(f, "{}::{:?}", std::stringify!(Self), self)
+    }
+}
+
+impl std::error::Error for TimeError {}
+
 #[derive(Debug, Clone, Copy, Eq, Hash, PartialEq)]
 pub enum NanosleepError {
     InterruptedBySignal(Duration),
@@ -244,6 +254,41 @@ impl Time {
     }
 }
 
+impl std::ops::Add<Duration> for Time {
+    type Output = Time;
+
+    fn add(self, rhs: Duration) -> Self::Output {
+        let sum = self.as_duration() + rhs;
+        Time {
+            clock_type: self.clock_type,
+            seconds: sum.as_secs(),
+            nanoseconds: sum.subsec_nanos(),
+        }
+    }
+}
+
+impl std::ops::AddAssign<Duration> for Time {
+    fn add_assign(&mut self, rhs: Duration) {
+        *self = *self + rhs;
+    }
+}
+
+/// Times are only comparable when they were acquired with the same [`ClockType`], otherwise
+/// [`None`] is returned.
+impl PartialOrd for Time {
+    fn partial_cmp(&self, other: &Self) -> Option<std::cmp::Ordering> {
+        if self.clock_type != other.clock_type {
+            return None;
+        }
+
+        Some(
+            self.seconds
+                .cmp(&other.seconds)
+                .then(self.nanoseconds.cmp(&other.nanoseconds)),
+        )
+    }
+}
+
 impl AsTimespec for Time {
     fn as_timespec(&self) -> posix::timespec {
         posix::timespec {
@@ -290,12 +335,33 @@ pub fn nanosleep_with_clock(
     duration: Duration,
     clock_type: ClockType,
 ) -> Result<(), NanosleepError> {
-    let wait_time = Time::now_with_clock(clock_type)?.as_duration() + duration;
+    nanosleep_until(Time::now_with_clock(clock_type)? + duration)
+}
 
-    let timeout = posix::timespec {
-        tv_sec: wait_time.as_secs() as posix::time_t,
-        tv_nsec: wait_time.subsec_nanos() as posix::long,
-    };
+/// Suspends the current thread until the absolute point in time `deadline` is reached on the
+/// [`ClockType`] of the deadline. When the deadline already passed it returns immediately.
+///
+/// In contrast to [`nanosleep()`], a periodic loop which advances its deadline by a fixed
+/// cycle time does not accumulate the time spent outside of the sleep call and therefore does
+/// not drift.
+///
+/// # Examples
+/// ```
+/// use iceoryx2_bb_posix::clock::*;
+/// use std::time::Duration;
+///
+/// const CYCLE_TIME: Duration = Duration::from_millis(10);
+///
+/// let mut deadline = Time::now().unwrap();
+/// for _ in 0..3 {
+///     deadline = deadline + CYCLE_TIME;
+///     // do some work
+///     nanosleep_until(deadline).unwrap();
+/// }
+/// ```
+pub fn nanosleep_until(deadline: Time) -> Result<(), NanosleepError> {
+    let clock_type = deadline.clock_type;
+    let timeout = deadline.as_timespec();
 
     let mut time_left = posix::timespec {
         tv_sec: 0,
@@ -303,26 +369,31 @@ pub fn nanosleep_with_clock(
     };
 
     let mut remaining_sleeping_time = Duration::ZERO;
-    handle_errno!(NanosleepError, from "nanosleep_with_clock",
-        errno_source unsafe {
-            let e = posix::clock_nanosleep(
-                clock_type as _,
-                posix::CLOCK_TIMER_ABSTIME,
-                &timeout,
-                &mut time_left,
-            ).into();
-
+    handle_errno!(NanosleepError, from "nanosleep_until",
+        errno_source {
+            let e = unsafe {
+                posix::clock_nanosleep(
+                    clock_type as _,
+                    posix::CLOCK_TIMER_ABSTIME,
+                    &timeout,
+                    &mut time_left,
+                ).into()
+            };
+
+            // with an absolute timeout the remaining time is not reported by
+            // clock_nanosleep and must be derived from the deadline
             if e == Errno::EINTR {
-                remaining_sleeping_time = Duration::from_secs(time_left.tv_sec as u64)
-                    + Duration::from_nanos(time_left.tv_nsec as u64);
+                remaining_sleeping_time = deadline
+                    .as_duration()
+                    .saturating_sub(Time::now_with_clock(clock_type)?.as_duration());
             }
             e
         },
         success Errno::ESUCCES => (),
         Errno::EINTR => (InterruptedBySignal(remaining_sleeping_time),
-            "Interrupted \"nanosleep\": {{ duration: {:?}, clock_type: {:?} }}, remaining sleeping time: {:?}", duration, clock_type, remaining_sleeping_time),
-        Errno::EINVAL => (DurationOutOfRange, "Invalid argument in \"nanosleep\". Either the duration: {:?} is out of range or the clock type {:?} is invalid.", duration, clock_type),
-        Errno::ENOTSUP => (ClockTypeIsNotSupported, "Clock not supported in \"nanosleep\": {{ duration: {:?}, clock_type: {:?} }}", duration, clock_type),
-        v => (UnknownError(v as i32), "Unknown error occurred in \"nanosleep\": {{ duration: {:?}, clock_type: {:?} }}, ({})", duration, clock_type, v)
+            "Interrupted \"nanosleep\": {{ deadline: {:?}, clock_type: {:?} }}, remaining sleeping time: {:?}", deadline.as_duration(), clock_type, remaining_sleeping_time),
+        Errno::EINVAL => (DurationOutOfRange, "Invalid argument in \"nanosleep\". Either the deadline: {:?} is out of range or the clock type {:?} is invalid.", deadline.as_duration(), clock_type),
+        Errno::ENOTSUP => (ClockTypeIsNotSupported, "Clock not supported in \"nanosleep\": {{ deadline: {:?}, clock_type: {:?} }}", deadline.as_duration(), clock_type),
+        v => (UnknownError(v as i32), "Unknown error occurred in \"nanosleep\": {{ deadline: {:?}, clock_type: {:?} }}, ({})", deadline.as_duration(), clock_type, v)
     );
 }
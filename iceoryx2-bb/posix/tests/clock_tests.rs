@@ -33,6 +33,24 @@ fn clock_nanosleep_with_clock_sleeps_at_least_given_amount_of_time() {
     assert_that!(start.elapsed(), time_at_least TIMEOUT);
 }
 
+#[test]
+fn clock_nanosleep_until_sleeps_until_deadline_is_reached() {
+    let start = Instant::now();
+    let deadline = Time::now().unwrap() + TIMEOUT;
+    assert_that!(nanosleep_until(deadline), is_ok);
+    assert_that!(start.elapsed(), time_at_least TIMEOUT);
+}
+
+#[test]
+fn clock_nanosleep_until_returns_immediately_when_deadline_has_passed() {
+    let deadline = Time::now().unwrap();
+    assert_that!(nanosleep(TIMEOUT), is_ok);
+
+    let start = Instant::now();
+    assert_that!(nanosleep_until(deadline), is_ok);
+    assert_that!(start.elapsed(), lt TIMEOUT);
+}
+
 #[test]
 fn clock_timebuilder_default_values_are_set_correctly() {
     let time = TimeBuilder::new().create();
@@ -62,6 +80,65 @@ fn clock_time_conversion_to_duration_works() {
     assert_that!(d.subsec_nanos(), eq time.nanoseconds());
 }
 
+#[test]
+fn clock_time_add_duration_works() {
+    let time = TimeBuilder::new()
+        .seconds(12)
+        .nanoseconds(999_999_000)
+        .clock_type(ClockType::Realtime)
+        .create();
+    let sut = time + Duration::from_nanos(2_000);
+
+    assert_that!(sut.seconds(), eq 13);
+    assert_that!(sut.nanoseconds(), eq 1_000);
+    assert_that!(sut.clock_type(), eq ClockType::Realtime);
+
+    let mut sut = time;
+    sut += Duration::from_nanos(2_000);
+    assert_that!(sut, eq time + Duration::from_nanos(2_000));
+
+    sut += Duration::from_secs(3);
+    assert_that!(sut.seconds(), eq 16);
+    assert_that!(sut.nanoseconds(), eq 1_000);
+    assert_that!(sut.clock_type(), eq ClockType::Realtime);
+}
+
+#[test]
+fn clock_time_ordering_works_with_same_clock() {
+    let time = TimeBuilder::new()
+        .seconds(12)
+        .nanoseconds(500)
+        .clock_type(ClockType::Realtime)
+        .create();
+    let later_nanoseconds = time + Duration::from_nanos(1);
+    let later_seconds = TimeBuilder::new()
+        .seconds(13)
+        .nanoseconds(0)
+        .clock_type(ClockType::Realtime)
+        .create();
+
+    assert_that!(time, lt later_nanoseconds);
+    assert_that!(later_nanoseconds, lt later_seconds);
+    assert_that!(later_seconds, gt time);
+    assert_that!(time, le time + Duration::ZERO);
+}
+
+#[test]
+fn clock_time_with_different_clocks_are_not_comparable() {
+    let realtime = TimeBuilder::new()
+        .seconds(12)
+        .clock_type(ClockType::Realtime)
+        .create();
+    let monotonic = TimeBuilder::new()
+        .seconds(13)
+        .clock_type(ClockType::Monotonic)
+        .create();
+
+    assert_that!(realtime.partial_cmp(&monotonic), eq None);
+    assert_that!(realtime < monotonic, eq false);
+    assert_that!(realtime > monotonic, eq false);
+}
+
 #[test]
 fn clock_time_now_is_monotonic_with_monotonic_clock() {
     test_requires!(Feature::MonotonicClock.is_available());
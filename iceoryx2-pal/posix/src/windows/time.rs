@@ -59,9 +59,9 @@ pub unsafe fn clock_nanosleep(
         return Errno::EINVAL as _;
     }
 
-    let time = Duration::from_secs((*rqtp).tv_sec as _)
-        + Duration::from_nanos((*rqtp).tv_nsec as _)
-        - now.unwrap();
+    let time = (Duration::from_secs((*rqtp).tv_sec as _)
+        + Duration::from_nanos((*rqtp).tv_nsec as _))
+    .saturating_sub(now.unwrap());
 
     std::thread::sleep(time);
     Errno::ESUCCES as _
@@ -54,13 +54,40 @@
 //! # Ok(())
 //! # }
 //! ```
+//!
+//! ## Drift-Free Event Loop
+//!
+//! ```no_run
+//! use core::time::Duration;
+//! use iceoryx2::clock::Time;
+//! use iceoryx2::prelude::*;
+//!
+//! # fn main() -> Result<(), Box<dyn std::error::Error>> {
+//! const CYCLE_TIME: Duration = Duration::from_secs(1);
+//!
+//! let mut deadline = Time::now()? + CYCLE_TIME;
+//! while let Iox2Event::Tick = Iox2::wait_until(deadline) {
+//!     deadline += CYCLE_TIME;
+//!     let now = Time::now()?;
+//!     if deadline < now {
+//!         // at least one cycle was missed, resync instead of catching up with a burst
+//!         deadline = now + CYCLE_TIME;
+//!     }
+//!     // your algorithm in here
+//! }
+//! # Ok(())
+//! # }
+//! ```
 
+use core::fmt::Debug;
 use core::time::Duration;
 use iceoryx2_bb_log::fatal_panic;
-use iceoryx2_bb_posix::clock::{nanosleep, NanosleepError};
+use iceoryx2_bb_posix::clock::{nanosleep, nanosleep_until, NanosleepError, Time};
 use iceoryx2_bb_posix::signal::SignalHandler;
 
-/// A complete list of all events that can occur in the main event loop, [`Iox2::wait()`].
+/// A complete list of all events that can occur in the main event loop, [`Iox2::wait()`] and
+/// [`Iox2::wait_until()`].
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum Iox2Event {
     Tick,
     TerminationRequest,
@@ -78,12 +105,16 @@ impl Iox2 {
         &INSTANCE
     }
 
-    fn wait_impl(&self, cycle_time: Duration) -> Iox2Event {
+    fn wait_impl<T: Debug + Copy>(
+        &self,
+        timeout: T,
+        sleep: fn(T) -> Result<(), NanosleepError>,
+    ) -> Iox2Event {
         if SignalHandler::termination_requested() {
             return Iox2Event::TerminationRequest;
         }
 
-        match nanosleep(cycle_time) {
+        match sleep(timeout) {
             Ok(()) => {
                 if SignalHandler::termination_requested() {
                     Iox2Event::TerminationRequest
@@ -94,8 +125,8 @@ impl Iox2 {
             Err(NanosleepError::InterruptedBySignal(_)) => Iox2Event::InterruptSignal,
             Err(v) => {
                 fatal_panic!(from self,
-                    "Failed to wait with cycle time {:?} in main event look, caused by ({:?}).",
-                    cycle_time, v);
+                    "Failed to wait with timeout {:?} in main event look, caused by ({:?}).",
+                    timeout, v);
             }
         }
     }
@@ -104,6 +135,16 @@ impl Iox2 {
     /// [`Iox2Event::Tick`] when the `cycle_time` has passed, otherwise the other event that
     /// can occur.
     pub fn wait(cycle_time: Duration) -> Iox2Event {
-        Self::get_instance().wait_impl(cycle_time)
+        Self::get_instance().wait_impl(cycle_time, nanosleep)
+    }
+
+    /// Waits until an event has received. It returns
+    /// [`Iox2Event::Tick`] when the `deadline` is reached, otherwise the other event that
+    /// can occur. When the `deadline` is advanced by a fixed cycle time in every iteration
+    /// the loop does not drift, since the runtime of the loop body is not added to the period.
+    /// When the `deadline` has already passed it returns immediately, therefore a loop that
+    /// missed a cycle should resync its `deadline` to the current time instead of catching up.
+    pub fn wait_until(deadline: Time) -> Iox2Event {
+        Self::get_instance().wait_impl(deadline, nanosleep_until)
     }
 }
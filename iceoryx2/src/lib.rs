@@ -274,6 +274,10 @@
 #[cfg(doctest)]
 mod compiletests;
 
+/// Time representation required for the deadline based event loop
+/// [`Iox2::wait_until()`](crate::iox2::Iox2::wait_until)
+pub mod clock;
+
 /// Handles iceoryx2s global configuration
 pub mod config;
 
@@ -13,4 +13,6 @@
 pub use crate::iox2::Iox2;
 pub use crate::iox2::Iox2Event;
 pub use crate::port::event_id::EventId;
-pub use crate::service::{process_local, service_name::ServiceName, zero_copy, Details, Service};
+pub use crate::service::{
+    process_local, service_name::ServiceName, zero_copy, CallbackProgress, Details, Service,
+};
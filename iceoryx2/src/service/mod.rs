@@ -177,8 +177,8 @@ impl std::fmt::Display for ServiceDoesExistError {
 
 impl std::error::Error for ServiceDoesExistError {}
 
-/// Failure that can be reported by [`Details::list()`] or
-/// [`Details::list_with_custom_config()`].
+/// Failure that can be reported by [`Details::list()`], [`Details::list_with_custom_config()`],
+/// [`Details::for_each()`] or [`Details::for_each_with_custom_config()`].
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum ServiceListError {
     InsufficientPermissions,
@@ -193,6 +193,15 @@ impl std::fmt::Display for ServiceListError {
 
 impl std::error::Error for ServiceListError {}
 
+/// Returned by the callback of [`Details::for_each()`] and
+/// [`Details::for_each_with_custom_config()`] to decide if the iteration over the services
+/// shall continue or stop.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum CallbackProgress {
+    Continue,
+    Stop,
+}
+
 /// Represents the [`Service`]s state.
 #[derive(Debug)]
 pub struct ServiceState<'config, Static: StaticStorage, Dynamic: DynamicStorage<DynamicConfig>> {
@@ -397,7 +406,7 @@ pub trait Details<'config>: Debug + Sized {
     /// # }
     /// ```
     fn list() -> Result<Vec<StaticConfig>, ServiceListError> {
-        Self::list_with_custom_config(config::Config::get_global_config())
+        list_services::<Self>("Service::list()", config::Config::get_global_config())
     }
 
     /// Returns a list of all services created under a given [`config::Config`].
@@ -421,61 +430,135 @@ pub trait Details<'config>: Debug + Sized {
     fn list_with_custom_config(
         config: &'config config::Config,
     ) -> Result<Vec<StaticConfig>, ServiceListError> {
-        let msg = "Unable to list all services";
-        let origin = "Service::list_from_config()";
-        let static_storage_config = config_scheme::static_config_storage_config::<Self>(config);
+        list_services::<Self>("Service::list_with_custom_config()", config)
+    }
 
-        let services = fail!(from origin,
-                when <Self::StaticStorage as NamedConceptMgmt>::list_cfg(&static_storage_config),
-                map NamedConceptListError::InsufficientPermissions => ServiceListError::InsufficientPermissions,
-                unmatched ServiceListError::InternalError,
-                "{} due to a failure while collecting all active services for config: {:?}", msg, config);
+    /// Calls the provided callback for every created service in the system until the callback
+    /// returns [`CallbackProgress::Stop`].
+    ///
+    /// # Example
+    ///
+    /// ```
+    /// use iceoryx2::prelude::*;
+    ///
+    /// # fn main() -> Result<(), Box<dyn std::error::Error>> {
+    /// zero_copy::Service::for_each(|service| {
+    ///     println!("\n{:#?}", &service);
+    ///     CallbackProgress::Continue
+    /// })?;
+    /// # Ok(())
+    /// # }
+    /// ```
+    fn for_each<F: FnMut(StaticConfig) -> CallbackProgress>(
+        callback: F,
+    ) -> Result<(), ServiceListError> {
+        for_each_service::<Self, _>(
+            "Service::for_each()",
+            config::Config::get_global_config(),
+            callback,
+        )
+    }
 
-        let mut service_vec = vec![];
-        for service_storage in services {
-            let reader =
-                match <<Self::StaticStorage as StaticStorage>::Builder as NamedConceptBuilder<
-                    Self::StaticStorage,
-                >>::new(&service_storage)
-                .config(&static_storage_config.clone())
-                .has_ownership(false)
-                .open()
-                {
-                    Ok(reader) => reader,
-                    Err(e) => {
-                        warn!(from origin, "Unable to acquire a list of all service since the static service info \"{}\" could not be opened for reading ({:?}).",
-                           service_storage, e );
-                        continue;
-                    }
-                };
+    /// Calls the provided callback for every service created under a given [`config::Config`]
+    /// until the callback returns [`CallbackProgress::Stop`].
+    /// In contrast to [`Details::list_with_custom_config()`] the static configs are handed over
+    /// one by one as soon as they are read and are not collected into a [`Vec`]. When the
+    /// iteration is stopped the remaining services are neither read nor deserialized.
+    ///
+    /// # Example
+    ///
+    /// ```
+    /// use iceoryx2::prelude::*;
+    /// use iceoryx2::config::Config;
+    ///
+    /// # fn main() -> Result<(), Box<dyn std::error::Error>> {
+    /// let mut custom_config = Config::default();
+    /// zero_copy::Service::for_each_with_custom_config(&custom_config, |service| {
+    ///     println!("\n{:#?}", &service);
+    ///     CallbackProgress::Continue
+    /// })?;
+    /// # Ok(())
+    /// # }
+    /// ```
+    fn for_each_with_custom_config<F: FnMut(StaticConfig) -> CallbackProgress>(
+        config: &'config config::Config,
+        callback: F,
+    ) -> Result<(), ServiceListError> {
+        for_each_service::<Self, _>("Service::for_each_with_custom_config()", config, callback)
+    }
+}
 
-            let mut content = String::from_utf8(vec![b' '; reader.len() as usize]).unwrap();
-            if let Err(e) = reader.read(unsafe { content.as_mut_vec().as_mut_slice() }) {
-                warn!(from origin, "Unable to acquire a list of all service since the static service info \"{}\" could not be read ({:?}).",
-                           service_storage, e );
+fn list_services<'config, S: Details<'config>>(
+    origin: &str,
+    config: &'config config::Config,
+) -> Result<Vec<StaticConfig>, ServiceListError> {
+    let mut service_vec = vec![];
+    for_each_service::<S, _>(origin, config, |service| {
+        service_vec.push(service);
+        CallbackProgress::Continue
+    })?;
+
+    Ok(service_vec)
+}
+
+fn for_each_service<'config, S: Details<'config>, F: FnMut(StaticConfig) -> CallbackProgress>(
+    origin: &str,
+    config: &'config config::Config,
+    mut callback: F,
+) -> Result<(), ServiceListError> {
+    let msg = "Unable to list all services";
+    let static_storage_config = config_scheme::static_config_storage_config::<S>(config);
+
+    let services = fail!(from origin,
+            when <S::StaticStorage as NamedConceptMgmt>::list_cfg(&static_storage_config),
+            map NamedConceptListError::InsufficientPermissions => ServiceListError::InsufficientPermissions,
+            unmatched ServiceListError::InternalError,
+            "{} due to a failure while collecting all active services for config: {:?}", msg, config);
+
+    for service_storage in services {
+        let reader = match <<S::StaticStorage as StaticStorage>::Builder as NamedConceptBuilder<
+            S::StaticStorage,
+        >>::new(&service_storage)
+        .config(&static_storage_config.clone())
+        .has_ownership(false)
+        .open()
+        {
+            Ok(reader) => reader,
+            Err(e) => {
+                warn!(from origin, "Unable to acquire a list of all service since the static service info \"{}\" could not be opened for reading ({:?}).",
+                       service_storage, e );
                 continue;
             }
+        };
 
-            let service_config = match Self::ConfigSerializer::deserialize::<StaticConfig>(unsafe {
-                content.as_mut_vec()
-            }) {
-                Ok(service_config) => service_config,
-                Err(e) => {
-                    warn!(from origin, "Unable to acquire a list of all service since the static service info \"{}\" could not be deserialized ({:?}).",
+        let mut content = String::from_utf8(vec![b' '; reader.len() as usize]).unwrap();
+        if let Err(e) = reader.read(unsafe { content.as_mut_vec().as_mut_slice() }) {
+            warn!(from origin, "Unable to acquire a list of all service since the static service info \"{}\" could not be read ({:?}).",
                        service_storage, e );
-                    continue;
-                }
-            };
+            continue;
+        }
 
-            if service_storage.as_bytes() != service_config.uuid().as_bytes() {
-                warn!(from origin, "Detected service {:?} with an inconsistent hash of {} when acquiring services according to config {:?}",
-                    service_config, service_storage, config);
+        let service_config = match S::ConfigSerializer::deserialize::<StaticConfig>(unsafe {
+            content.as_mut_vec()
+        }) {
+            Ok(service_config) => service_config,
+            Err(e) => {
+                warn!(from origin, "Unable to acquire a list of all service since the static service info \"{}\" could not be deserialized ({:?}).",
+                   service_storage, e );
                 continue;
             }
+        };
 
-            service_vec.push(service_config);
+        if service_storage.as_bytes() != service_config.uuid().as_bytes() {
+            warn!(from origin, "Detected service {:?} with an inconsistent hash of {} when acquiring services according to config {:?}",
+                service_config, service_storage, config);
+            continue;
         }
 
-        Ok(service_vec)
+        if callback(service_config) == CallbackProgress::Stop {
+            break;
+        }
     }
+
+    Ok(())
 }
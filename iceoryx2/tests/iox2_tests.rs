@@ -0,0 +1,46 @@
+// Copyright (c) 2023 Contributors to the Eclipse Foundation
+//
+// See the NOTICE file(s) distributed with this work for additional
+// information regarding copyright ownership.
+//
+// This program and the accompanying materials are made available under the
+// terms of the Apache Software License 2.0 which is available at
+// https://www.apache.org/licenses/LICENSE-2.0, or the MIT license
+// which is available at https://opensource.org/licenses/MIT.
+//
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+
+use std::time::{Duration, Instant};
+
+use iceoryx2::clock::Time;
+use iceoryx2::iox2::{Iox2, Iox2Event};
+use iceoryx2_bb_testing::assert_that;
+
+const TIMEOUT: Duration = Duration::from_millis(25);
+
+#[test]
+fn iox2_wait_until_returns_tick_immediately_when_deadline_has_passed() {
+    let deadline = Time::now().unwrap();
+    std::thread::sleep(TIMEOUT);
+
+    let start = Instant::now();
+    assert_that!(Iox2::wait_until(deadline), eq Iox2Event::Tick);
+    assert_that!(start.elapsed(), lt TIMEOUT);
+}
+
+#[test]
+fn iox2_wait_until_returns_tick_when_deadline_is_reached() {
+    let start = Instant::now();
+    let deadline = Time::now().unwrap() + TIMEOUT;
+
+    assert_that!(Iox2::wait_until(deadline), eq Iox2Event::Tick);
+    assert_that!(start.elapsed(), time_at_least TIMEOUT);
+}
+
+#[test]
+fn iox2_wait_returns_tick_when_cycle_time_has_passed() {
+    let start = Instant::now();
+
+    assert_that!(Iox2::wait(TIMEOUT), eq Iox2Event::Tick);
+    assert_that!(start.elapsed(), time_at_least TIMEOUT);
+}
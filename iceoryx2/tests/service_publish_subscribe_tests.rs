@@ -19,7 +19,7 @@ mod service_publish_subscribe {
     use iceoryx2::service::builder::publish_subscribe::PublishSubscribeOpenError;
     use iceoryx2::service::port_factory::publisher::UnableToDeliverStrategy;
     use iceoryx2::service::static_config::StaticConfig;
-    use iceoryx2::service::{service_name::ServiceName, Details, Service};
+    use iceoryx2::service::{service_name::ServiceName, CallbackProgress, Details, Service};
     use iceoryx2_bb_posix::unique_system_id::UniqueSystemId;
     use iceoryx2_bb_testing::assert_that;
 
@@ -1159,6 +1159,125 @@ mod service_publish_subscribe {
         }
     }
 
+    fn collect_services<Sut: Service + Details<'static>>(
+        config: Option<&'static Config>,
+    ) -> Vec<StaticConfig> {
+        let mut found_services = vec![];
+        let callback = |service| {
+            found_services.push(service);
+            CallbackProgress::Continue
+        };
+
+        let result = match config {
+            Some(config) => Sut::for_each_with_custom_config(config, callback),
+            None => Sut::for_each(callback),
+        };
+        assert_that!(result, is_ok);
+
+        found_services
+    }
+
+    fn contains_service_names(names: &[ServiceName], state: &[StaticConfig]) -> bool {
+        names
+            .iter()
+            .all(|n| state.iter().any(|s| s.service_name() == n))
+    }
+
+    #[test]
+    fn for_each_works<Sut: Service + Details<'static>>() {
+        const NUMBER_OF_SERVICES: usize = 8;
+
+        let mut services = vec![];
+        let mut service_names = vec![];
+
+        for i in 0..NUMBER_OF_SERVICES {
+            let service_name = generate_name();
+
+            services.push(
+                Sut::new(&service_name)
+                    .publish_subscribe()
+                    .create::<u64>()
+                    .unwrap(),
+            );
+            service_names.push(service_name);
+
+            let found_services = collect_services::<Sut>(None);
+            assert_that!(found_services, len i + 1);
+            assert_that!(contains_service_names(&service_names, &found_services), eq true);
+        }
+
+        for i in 0..NUMBER_OF_SERVICES {
+            services.pop();
+            service_names.pop();
+
+            let found_services = collect_services::<Sut>(None);
+            assert_that!(found_services, len NUMBER_OF_SERVICES - i - 1);
+            assert_that!(contains_service_names(&service_names, &found_services), eq true);
+        }
+    }
+
+    #[test]
+    fn for_each_with_custom_config_works<Sut: Service + Details<'static>>() {
+        const NUMBER_OF_SERVICES: usize = 8;
+
+        let mut custom_config = Config::default();
+        custom_config.global.prefix =
+            format!("iox2_for_each_{}_", UniqueSystemId::new().unwrap().value());
+        let custom_config: &'static Config = Box::leak(Box::new(custom_config));
+
+        let mut services = vec![];
+        let mut service_names = vec![];
+
+        for i in 0..NUMBER_OF_SERVICES {
+            let service_name = generate_name();
+
+            services.push(
+                Sut::new(&service_name)
+                    .publish_subscribe_with_custom_config(custom_config)
+                    .create::<u64>()
+                    .unwrap(),
+            );
+            service_names.push(service_name);
+
+            let found_services = collect_services::<Sut>(Some(custom_config));
+            assert_that!(found_services, len i + 1);
+            assert_that!(contains_service_names(&service_names, &found_services), eq true);
+        }
+
+        for i in 0..NUMBER_OF_SERVICES {
+            services.pop();
+            service_names.pop();
+
+            let found_services = collect_services::<Sut>(Some(custom_config));
+            assert_that!(found_services, len NUMBER_OF_SERVICES - i - 1);
+            assert_that!(contains_service_names(&service_names, &found_services), eq true);
+        }
+    }
+
+    #[test]
+    fn for_each_stops_when_callback_returns_stop<Sut: Service + Details<'static>>() {
+        const NUMBER_OF_SERVICES: usize = 4;
+
+        let mut services = vec![];
+        for _ in 0..NUMBER_OF_SERVICES {
+            services.push(
+                Sut::new(&generate_name())
+                    .publish_subscribe()
+                    .create::<u64>()
+                    .unwrap(),
+            );
+        }
+
+        let mut number_of_calls = 0;
+        let result = Sut::for_each(|_| {
+            number_of_calls += 1;
+            CallbackProgress::Stop
+        });
+
+        assert_that!(result, is_ok);
+        assert_that!(number_of_calls, eq 1);
+    }
+
     #[instantiate_tests(<iceoryx2::service::zero_copy::Service>)]
     mod zero_copy {}
 